@@ -15,138 +15,192 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import os
+import queue
 import shutil
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List
 
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+# Resolve shared locations once instead of rebuilding the same paths per call
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_CASES_DIR = _REPO_ROOT / 'tests' / 'cases'
+_DEBUG_CASES_DIR = _REPO_ROOT / 'tests' / 'debug' / 'cases'
+
 # Add src to path (from scripts directory, go up one level to repo root)
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(_REPO_ROOT / 'src'))
 
 from ignition_lint.common.flatten_json import read_json_file, flatten_json
 from ignition_lint.linter import LintEngine
-from ignition_lint.rules import RULES_MAP
+from ignition_lint.rules import get_rules_map
+
+# The README content is invariant apart from the case name, so keep the text as
+# a module constant instead of rebuilding the full string per case
+_README_TEMPLATE = """# Debug Golden Output Files for {name}
+Regenerate these files whenever the view.json is updated or when model builder logic changes.
+These files help developers diagnose issues with the model building and rule application processes.
+
+This directory contains debug information generated from `tests/cases/{name}/view.json`:
+
+## Files
+
+- **`flattened.json`**: The flattened path-value representation of the original JSON
+- **`model.json`**: The serialized object model with all nodes organized by type
+- **`stats.json`**: Comprehensive statistics including node counts and rule coverage
+
+## Generation
+
+These files were generated using:
+```bash
+python scripts/generate_debug_files.py {name}
+```
+
+## Usage
+
+These files help developers understand:
+1. How the JSON flattening process works
+2. What nodes the model builder creates
+3. Which rules apply to which nodes
+4. Statistics about the view structure
+
+"""
+
+
+def dump_json_file(path: Path, obj) -> None:
+	"""Write obj to path as pretty-printed, key-sorted JSON, using orjson when available."""
+	if orjson is not None:
+		path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+	else:
+		path.write_text(json.dumps(obj, indent=2, sort_keys=True), encoding='utf-8')
 
 
 def get_test_cases() -> List[Path]:
 	"""Get all test case directories that contain view.json files."""
-	# From scripts directory, go up one level to repo root, then to tests/cases
-	cases_dir = Path(__file__).parent.parent / 'tests' / 'cases'
 	test_cases = []
 
-	for case_dir in cases_dir.iterdir():
+	for case_dir in _CASES_DIR.iterdir():
 		if case_dir.is_dir() and (case_dir / 'view.json').exists():
 			test_cases.append(case_dir)
 
-	return sorted(test_cases)
+	# All paths share the same parent, so compare names instead of Path parts
+	return sorted(test_cases, key=lambda case_dir: case_dir.name)
 
 
 def create_lint_engine() -> LintEngine:
 	"""Create a lint engine exactly like the golden file test does."""
-	# Store rule classes for creating fresh engines (same logic as test)
-	rule_classes = []
-	for rule_name, rule_class in RULES_MAP.items():
+	# Construct each default-configurable rule exactly once; DEFAULT_CONFIG_OK
+	# replaces the old probe-then-construct double pass
+	rules = []
+	for rule_name, rule_class in get_rules_map().items():
+		if not getattr(rule_class, 'DEFAULT_CONFIG_OK', True):
+			continue
 		try:
-			# Test that we can create the rule (same as test)
-			rule_class.create_from_config({})
-			rule_classes.append(rule_class)
+			rules.append(rule_class.create_from_config({}))
 		except (TypeError, ValueError, AttributeError) as e:
 			print(f"Warning: Could not create rule {rule_name}: {e}")
 
-	# Create fresh rules (same as test)
-	rules = []
-	for rule_class in rule_classes:
-		rules.append(rule_class.create_from_config({}))
-
 	return LintEngine(rules)
 
 
-def generate_debug_files_for_case(case_dir: Path, lint_engine: LintEngine) -> bool:
-	"""Generate debug files for a specific test case."""
+def debug_files_up_to_date(case_dir: Path) -> bool:
+	"""Check whether the case's debug files are newer than its view.json."""
+	try:
+		model_mtime = (_DEBUG_CASES_DIR / case_dir.name / 'model.json').stat().st_mtime
+		return model_mtime >= (case_dir / 'view.json').stat().st_mtime
+	except FileNotFoundError:
+		return False
+
+
+def generate_debug_files_for_case(
+	case_dir: Path, lint_engine: LintEngine, force: bool = False, flattened_json=None
+) -> bool:
+	"""
+	Generate debug files for a specific test case, skipping up-to-date ones unless forced.
+
+	A prefetched flattened_json may be supplied to skip the read/flatten step.
+	"""
 	view_file = case_dir / 'view.json'
 	# Create debug files in tests/debug/cases/{case_name}/ instead of in the test case directory
-	repo_root = Path(__file__).parent.parent
-	debug_dir = repo_root / 'tests' / 'debug' / 'cases' / case_dir.name
+	debug_dir = _DEBUG_CASES_DIR / case_dir.name
 
 	if not view_file.exists():
 		print(f"❌ No view.json found in {case_dir.name}")
 		return False
 
+	# Skip the rebuild when the debug files are already newer than the view.json
+	if not force and debug_files_up_to_date(case_dir):
+		print(f"⏭️  Debug files for {case_dir.name} are up to date")
+		return True
+
 	try:
-		# Read and flatten the JSON
-		json_data = read_json_file(view_file)
-		flattened_json = flatten_json(json_data)
+		# Read and flatten the JSON unless a prefetched copy was handed in
+		if flattened_json is None:
+			flattened_json = flatten_json(read_json_file(view_file))
 
-		# Build the model
-		lint_engine.flattened_json = flattened_json
-		lint_engine.view_model = lint_engine.get_view_model()
+		# Build the model once and get the serialized form and statistics from the same build
+		_, serialized_model, stats = lint_engine.process_view(flattened_json)
 
 		# Create debug directory (including parent directories)
 		debug_dir.mkdir(parents=True, exist_ok=True)
 
-		# Save flattened JSON
-		with open(debug_dir / 'flattened.json', 'w', encoding='utf-8') as f:
-			json.dump(flattened_json, f, indent=2, sort_keys=True)
+		# Each dump is a single buffered write of the fully serialized document
+		dump_json_file(debug_dir / 'flattened.json', flattened_json)
 
 		# Save serialized model
-		serialized_model = lint_engine.serialize_view_model()
-		with open(debug_dir / 'model.json', 'w', encoding='utf-8') as f:
-			json.dump(serialized_model, f, indent=2, sort_keys=True)
+		dump_json_file(debug_dir / 'model.json', serialized_model)
 
 		# Save statistics
-		stats = lint_engine.get_model_statistics(flattened_json)
-		with open(debug_dir / 'stats.json', 'w', encoding='utf-8') as f:
-			json.dump(stats, f, indent=2, sort_keys=True)
+		dump_json_file(debug_dir / 'stats.json', stats)
 
 		# Save a README explaining the debug files
-		readme_content = f"""# Debug Golden Output Files for {case_dir.name}
-Regenerate these files whenever the view.json is updated or when model builder logic changes.
-These files help developers diagnose issues with the model building and rule application processes.
+		(debug_dir / 'README.md').write_text(_README_TEMPLATE.format(name=case_dir.name), encoding='utf-8')
 
-This directory contains debug information generated from `tests/cases/{case_dir.name}/view.json`:
-
-## Files
-
-- **`flattened.json`**: The flattened path-value representation of the original JSON
-- **`model.json`**: The serialized object model with all nodes organized by type
-- **`stats.json`**: Comprehensive statistics including node counts and rule coverage
-
-## Generation
+		print(f"✅ Generated debug files for {case_dir.name}")
+		return True
 
-These files were generated using:
-```bash
-python scripts/generate_debug_files.py {case_dir.name}
-```
+	except (OSError, PermissionError, TypeError, ValueError, json.JSONDecodeError) as e:
+		print(f"❌ Failed to generate debug files for {case_dir.name}: {e}")
+		return False
 
-## Usage
 
-These files help developers understand:
-1. How the JSON flattening process works
-2. What nodes the model builder creates
-3. Which rules apply to which nodes
-4. Statistics about the view structure
+@functools.lru_cache(maxsize=1)
+def get_worker_engine() -> LintEngine:
+	"""Create (once per process) the lint engine used by pool workers."""
+	return create_lint_engine()
 
-"""
 
-		with open(debug_dir / 'README.md', 'w', encoding='utf-8') as f:
-			f.write(readme_content)
+def generate_debug_files_for_case_worker(case_dir: Path, force: bool = False) -> bool:
+	"""Process-pool entry point: generate debug files for one case using a per-process engine."""
+	return generate_debug_files_for_case(case_dir, get_worker_engine(), force=force)
 
-		print(f"✅ Generated debug files for {case_dir.name}")
-		return True
 
-	except (OSError, PermissionError, TypeError, ValueError, json.JSONDecodeError) as e:
-		print(f"❌ Failed to generate debug files for {case_dir.name}: {e}")
-		return False
+def _prefetch_cases(case_dirs: List[Path], force: bool, output_queue: queue.Queue):
+	"""Producer: read and flatten the next case's view.json while the consumer builds models."""
+	for case_dir in case_dirs:
+		flattened_json = None
+		view_file = case_dir / 'view.json'
+		if view_file.exists() and (force or not debug_files_up_to_date(case_dir)):
+			try:
+				flattened_json = flatten_json(read_json_file(view_file))
+			except (OSError, TypeError, ValueError):
+				flattened_json = None  # Let the consumer re-read and report the failure
+		output_queue.put((case_dir, flattened_json))
+	output_queue.put(None)
 
 
 def clean_debug_directories():
 	"""Remove all debug directories."""
-	repo_root = Path(__file__).parent.parent
-	debug_cases_dir = repo_root / 'tests' / 'debug' / 'cases'
-
-	if debug_cases_dir.exists():
-		shutil.rmtree(debug_cases_dir)
+	if _DEBUG_CASES_DIR.exists():
+		shutil.rmtree(_DEBUG_CASES_DIR)
 		print("🗑️  Removed tests/debug/cases directory")
 	else:
 		print("No tests/debug/cases directory found to remove")
@@ -155,13 +209,15 @@ def clean_debug_directories():
 def list_test_cases():
 	"""List all available test cases."""
 	test_cases = get_test_cases()
-	repo_root = Path(__file__).parent.parent
-	debug_cases_dir = repo_root / 'tests' / 'debug' / 'cases'
+
+	# One directory read instead of a stat per test case
+	existing_debug_dirs = frozenset(
+		entry.name for entry in os.scandir(_DEBUG_CASES_DIR)
+	) if _DEBUG_CASES_DIR.exists() else frozenset()
 
 	print(f"Available test cases ({len(test_cases)}):")
 	for case_dir in test_cases:
-		debug_exists = (debug_cases_dir / case_dir.name).exists()
-		status = "🔍" if debug_exists else "  "
+		status = "🔍" if case_dir.name in existing_debug_dirs else "  "
 		print(f"  {status} {case_dir.name}")
 
 	print("\n🔍 = has debug files")
@@ -173,6 +229,11 @@ def main():
 	parser.add_argument('test_cases', nargs='*', help='Specific test case names to process (default: all)')
 	parser.add_argument('--clean', action='store_true', help='Remove all debug directories')
 	parser.add_argument('--list', action='store_true', help='List available test cases')
+	parser.add_argument('--force', action='store_true', help='Regenerate debug files even when up to date')
+	parser.add_argument(
+		'--jobs', type=int, default=os.cpu_count(),
+		help='Number of worker processes (default: CPU count, 1 disables the pool)'
+	)
 
 	args = parser.parse_args()
 
@@ -191,7 +252,7 @@ def main():
 		# Process specific test cases
 		test_cases_to_process = []
 		for case_name in args.test_cases:
-			case_dir = Path(__file__).parent.parent / 'tests' / 'cases' / case_name
+			case_dir = _CASES_DIR / case_name
 			if case_dir in all_test_cases:
 				test_cases_to_process.append(case_dir)
 			else:
@@ -206,15 +267,35 @@ def main():
 
 	print(f"Generating debug files for {len(test_cases_to_process)} test case(s)...")
 
-	# Create lint engine
-	lint_engine = create_lint_engine()
-	print(f"Created lint engine with {len(lint_engine.rules)} rules")
-
-	# Process each test case
+	# Cases are independent (JSON parse + model build + writes), so fan out across cores
 	success_count = 0
-	for case_dir in test_cases_to_process:
-		if generate_debug_files_for_case(case_dir, lint_engine):
-			success_count += 1
+	if args.jobs > 1 and len(test_cases_to_process) > 1:
+		with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+			futures = [
+				executor.submit(generate_debug_files_for_case_worker, case_dir, args.force)
+				for case_dir in test_cases_to_process
+			]
+			for future in as_completed(futures):
+				if future.result():
+					success_count += 1
+	else:
+		lint_engine = create_lint_engine()
+		print(f"Created lint engine with {len(lint_engine.rules)} rules")
+
+		# Overlap the next case's read/flatten I/O with the current model build
+		prefetch_queue = queue.Queue(maxsize=2)
+		prefetcher = threading.Thread(
+			target=_prefetch_cases, args=(test_cases_to_process, args.force, prefetch_queue), daemon=True
+		)
+		prefetcher.start()
+
+		while (item := prefetch_queue.get()) is not None:
+			case_dir, flattened_json = item
+			if generate_debug_files_for_case(
+				case_dir, lint_engine, force=args.force, flattened_json=flattened_json
+			):
+				success_count += 1
+		prefetcher.join()
 
 	print(f"\n📈 Summary: {success_count}/{len(test_cases_to_process)} test cases processed successfully")
 
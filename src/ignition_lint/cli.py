@@ -3,18 +3,25 @@ Command-line interface for ignition-lint.
 """
 
 import json
+import os
+import re
 import sys
 import argparse
 import glob
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
 # Handle both relative and absolute imports
 try:
 	# Try relative imports first (when run as module)
 	from .common.flatten_json import read_json_file, flatten_json
 	from .linter import LintEngine
-	from .rules import RULES_MAP
+	from .rules import get_rules_map
 except ImportError:
 	# Fall back to absolute imports (when run directly or from tests)
 	current_dir = Path(__file__).parent
@@ -24,15 +31,19 @@ except ImportError:
 
 	from ignition_lint.common.flatten_json import read_json_file, flatten_json
 	from ignition_lint.linter import LintEngine
-	from ignition_lint.rules import RULES_MAP
+	from ignition_lint.rules import get_rules_map
 
 
 def load_config(config_path: str) -> dict:
-	"""Load configuration from a JSON file."""
+	"""Load configuration from a JSON file, using orjson when available."""
+	# ValueError covers both json.JSONDecodeError and orjson.JSONDecodeError
 	try:
+		if orjson is not None:
+			with open(config_path, 'rb') as f:
+				return orjson.loads(f.read())
 		with open(config_path, 'r', encoding='utf-8') as f:
 			return json.load(f)
-	except (FileNotFoundError, json.JSONDecodeError) as e:
+	except (FileNotFoundError, ValueError) as e:
 		print(f"Error loading config file {config_path}: {e}")
 		return {}
 
@@ -40,6 +51,8 @@ def load_config(config_path: str) -> dict:
 def create_rules_from_config(config: dict) -> list:
 	"""Create rule instances from config dictionary using self-processing rules."""
 	rules = []
+	# Resolved here rather than at import so rule discovery stays lazy
+	rules_map = get_rules_map()
 	for rule_name, rule_config in config.items():
 		# Skip private keys or invalid configurations
 		if rule_name.startswith("_") or not isinstance(rule_config, dict):
@@ -49,11 +62,12 @@ def create_rules_from_config(config: dict) -> list:
 			print(f"Skipping rule {rule_name} (config['enabled'] == False)")
 			continue
 
-		if rule_name not in RULES_MAP:
+		# Single hash lookup instead of a membership test plus an indexing
+		rule_class = rules_map.get(rule_name)
+		if rule_class is None:
 			print(f"Unknown rule: {rule_name}")
 			continue
 
-		rule_class = RULES_MAP[rule_name]
 		kwargs = rule_config.get('kwargs', {})
 
 		try:
@@ -75,8 +89,46 @@ def get_view_file(file_path: Path) -> Dict[str, Any]:
 		return {}
 
 
+# Characters that make a glob pattern segment non-literal
+_GLOB_MAGIC = re.compile(r'[*?\[\]]')
+
+
+def _walk_for_filename(root: str, filename: str) -> List[Path]:
+	"""
+	Recursively collect files with an exact name under root using os.scandir.
+
+	Entry names are compared before entry types are checked, so files that
+	don't match never cost a stat call. Symlinks are followed for both file
+	and directory checks, mirroring glob's '**' behavior, and the result is
+	sorted so every run lints files in the same deterministic order.
+	"""
+	matches = []
+	stack = [root]
+	while stack:
+		try:
+			with os.scandir(stack.pop()) as entries:
+				for entry in entries:
+					# glob's '**' never matches hidden directories, so the
+					# walk must skip them (.git, .venv, ...) to stay equivalent
+					if entry.name.startswith("."):
+						continue
+					if entry.name == filename and entry.is_file():
+						matches.append(Path(entry.path))
+					elif entry.is_dir():
+						stack.append(entry.path)
+		except (PermissionError, FileNotFoundError, NotADirectoryError):
+			continue
+	matches.sort()
+	return matches
+
+
 def collect_files(args) -> List[Path]:
-	"""Collect files to process based on arguments."""
+	"""
+	Collect files to process based on arguments.
+
+	Every returned path existed at collection time; downstream processing
+	relies on this invariant instead of re-statting each file.
+	"""
 	files_to_process = []
 
 	# If filenames are provided directly (e.g., from pre-commit), use them
@@ -92,7 +144,20 @@ def collect_files(args) -> List[Path]:
 	elif args.files:
 		for file_pattern in args.files.split(","):
 			pattern = file_pattern.strip()
-			matching_files = glob.glob(pattern, recursive=True)
+
+			# Fast path: '<literal prefix>/**/view.json' needs no glob
+			# machinery, just a directory walk filtered by the literal
+			# filename. The '**' must be its own path component — a pattern
+			# like 'src**/view.json' means 'src*/view.json' to glob and has
+			# to take the glob path.
+			if pattern == "**/view.json" or pattern.endswith("/**/view.json"):
+				prefix = pattern[:-len("**/view.json")].rstrip("/")
+				if not _GLOB_MAGIC.search(prefix):
+					files_to_process.extend(_walk_for_filename(prefix or ".", "view.json"))
+					continue
+
+			# Sorted to match the fast path's deterministic ordering
+			matching_files = sorted(glob.glob(pattern, recursive=True))
 
 			for file_path_str in matching_files:
 				file_path = Path(file_path_str)
@@ -114,26 +179,33 @@ def print_file_results(file_path: Path, lint_results) -> tuple[int, int]:
 	Returns:
 		tuple[int, int]: (warning_count, error_count)
 	"""
-	warning_count = sum(len(warning_list) for warning_list in lint_results.warnings.values())
-	error_count = sum(len(error_list) for error_list in lint_results.errors.values())
+	# Totals are tallied while the engine collects results, so clean files
+	# cost two attribute reads here instead of a dict traversal
+	warning_count = lint_results.warning_count
+	error_count = lint_results.error_count
+	if warning_count == 0 and error_count == 0:
+		return 0, 0
+
+	# Batch the report into a single stdout write instead of one per line
+	lines = []
 
 	# Print warnings first
 	if warning_count > 0:
-		print(f"\n⚠️  Found {warning_count} warnings in {file_path}:")
+		lines.append(f"\n⚠️  Found {warning_count} warnings in {file_path}:")
 		for rule_name, warning_list in lint_results.warnings.items():
 			if warning_list:
-				print(f"  📋 {rule_name} (warning):")
-				for warning in warning_list:
-					print(f"    • {warning}")
+				lines.append(f"  📋 {rule_name} (warning):")
+				lines.extend(f"    • {warning}" for warning in warning_list)
 
 	# Print errors
 	if error_count > 0:
-		print(f"\n❌ Found {error_count} errors in {file_path}:")
+		lines.append(f"\n❌ Found {error_count} errors in {file_path}:")
 		for rule_name, error_list in lint_results.errors.items():
 			if error_list:
-				print(f"  📋 {rule_name} (error):")
-				for error in error_list:
-					print(f"    • {error}")
+				lines.append(f"  📋 {rule_name} (error):")
+				lines.extend(f"    • {error}" for error in error_list)
+
+	sys.stdout.write('\n'.join(lines) + '\n')
 
 	return warning_count, error_count
 
@@ -141,59 +213,64 @@ def print_file_results(file_path: Path, lint_results) -> tuple[int, int]:
 def print_statistics(file_path: Path, stats: Dict[str, Any], verbose: bool = False):
 	"""Print model statistics for a file."""
 	if verbose:
-		print(f"\n📊 Model statistics for {file_path}:")
-		print(f"  Total nodes: {stats['total_nodes']}")
+		lines = [f"\n📊 Model statistics for {file_path}:", f"  Total nodes: {stats['total_nodes']}"]
 
-		print("  Node types found:")
+		lines.append("  Node types found:")
 		for node_type, count in stats['node_type_counts'].items():
-			print(f"    {node_type}: {count}")
+			lines.append(f"    {node_type}: {count}")
 
 		if stats['components_by_type']:
-			print("  Components by type:")
+			lines.append("  Components by type:")
 			for comp_type, count in stats['components_by_type'].items():
-				print(f"    {comp_type}: {count}")
+				lines.append(f"    {comp_type}: {count}")
 
 		if stats.get('rule_coverage'):
-			print("  Rule coverage:")
+			lines.append("  Rule coverage:")
 			for rule_name, coverage in stats['rule_coverage'].items():
 				target_types = ', '.join(coverage['target_types'])
-				print(f"    {rule_name}: {coverage['applicable_node_count']} nodes ({target_types})")
+				lines.append(f"    {rule_name}: {coverage['applicable_node_count']} nodes ({target_types})")
+
+		sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def print_rule_analysis(lint_engine: LintEngine, flattened_json: Dict[str, Any]):
 	"""Print detailed rule impact analysis."""
 	analysis = lint_engine.analyze_rule_impact(flattened_json)
 
-	print("\n🔍 Rule Impact Analysis:")
+	lines = ["\n🔍 Rule Impact Analysis:"]
 	for rule_name, rule_data in analysis.items():
-		print(f"  📋 {rule_name}:")
-		print(f"    Targets: {', '.join(rule_data['target_types'])}")
-		print(f"    Will process: {rule_data['applicable_nodes']} nodes")
+		lines.append(f"  📋 {rule_name}:")
+		lines.append(f"    Targets: {', '.join(rule_data['target_types'])}")
+		lines.append(f"    Will process: {rule_data['applicable_nodes']} nodes")
 
 		if rule_data['node_details']:
-			print("    Sample nodes:")
+			lines.append("    Sample nodes:")
 			for detail in rule_data['node_details']:
-				print(f"      • {detail['path']}: {detail['summary']}")
+				lines.append(f"      • {detail['path']}: {detail['summary']}")
 		elif rule_data['sample_paths']:
-			print(f"    Sample paths: {', '.join(rule_data['sample_paths'][:3])}")
-		print()
+			lines.append(f"    Sample paths: {', '.join(rule_data['sample_paths'][:3])}")
+		lines.append("")
+
+	sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def print_debug_nodes(lint_engine: LintEngine, flattened_json: Dict[str, Any], debug_node_types: List[str]):
 	"""Print debug information for specific node types."""
 	debug_nodes = lint_engine.debug_nodes(flattened_json, debug_node_types or [])
 	if debug_node_types:
-		print(f"\n🔧 Debug info for node types: {', '.join(debug_node_types)}")
+		lines = [f"\n🔧 Debug info for node types: {', '.join(debug_node_types)}"]
 	else:
-		print("\n🔧 Debug info for all nodes:")
+		lines = ["\n🔧 Debug info for all nodes:"]
 
 	for i, node_info in enumerate(debug_nodes[:10]):  # Limit to first 10
-		print(f"  {i+1}. {node_info['path']} ({node_info['node_type']})")
+		lines.append(f"  {i+1}. {node_info['path']} ({node_info['node_type']})")
 		if 'summary' in node_info:
-			print(f"     {node_info['summary']}")
+			lines.append(f"     {node_info['summary']}")
 
 	if len(debug_nodes) > 10:
-		print(f"     ... and {len(debug_nodes) - 10} more nodes")
+		lines.append(f"     ... and {len(debug_nodes) - 10} more nodes")
+
+	sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def setup_linter(args) -> LintEngine:
@@ -226,19 +303,19 @@ def setup_linter(args) -> LintEngine:
 
 def process_single_file(file_path: Path, lint_engine: LintEngine, args) -> tuple[int, int]:
 	"""Process a single view file and return the warning and error counts."""
-	if not file_path.exists():
-		print(f"⚠️  File {file_path} does not exist, skipping")
-		return 0, 0
-
+	# collect_files guarantees the path existed; get_view_file reports any
+	# read failure, so no second stat is needed here
 	# Read and flatten the JSON file
 	flattened_json = get_view_file(file_path)
 	if not flattened_json:
 		print(f"❌ Failed to read or parse {file_path}, skipping")
 		return 0, 0
 
-	# Get statistics
-	stats = lint_engine.get_model_statistics(flattened_json)
-	print_statistics(file_path, stats, args.verbose or args.stats_only)
+	# Statistics require a full model walk, so only compute them when they
+	# will actually be printed
+	if args.verbose or args.stats_only:
+		stats = lint_engine.get_model_statistics(flattened_json)
+		print_statistics(file_path, stats, verbose=True)
 
 	# Show rule analysis if requested
 	if args.analyze_rules and not args.stats_only:
@@ -13,10 +13,12 @@ from .model.node_types import NodeType, NodeUtils
 
 
 class LintResults(NamedTuple):
-	"""Results from linting process."""
+	"""Results from linting process, with totals tallied at collection time."""
 	warnings: Dict[str, List[str]]
 	errors: Dict[str, List[str]]
 	has_errors: bool
+	warning_count: int = 0
+	error_count: int = 0
 
 
 class LintEngine:
@@ -61,6 +63,8 @@ class LintEngine:
 
 		warnings = {}
 		errors = {}
+		warning_count = 0
+		error_count = 0
 
 		# Apply each rule to the nodes
 		for rule in self.rules:
@@ -74,18 +78,43 @@ class LintEngine:
 			# Collect warnings from this rule
 			if rule.warnings:
 				warnings[rule.error_key] = rule.warnings
+				warning_count += len(rule.warnings)
 
 			# Collect errors from this rule
 			if rule.errors:
 				errors[rule.error_key] = rule.errors
+				error_count += len(rule.errors)
 
-		return LintResults(warnings=warnings, errors=errors, has_errors=bool(errors))
+		return LintResults(
+			warnings=warnings, errors=errors, has_errors=bool(errors), warning_count=warning_count,
+			error_count=error_count
+		)
+
+	def process_view(self, flattened_json: Dict[str, Any]) -> tuple:
+		"""
+		Build the view model once and return it alongside its serialized form and statistics.
+
+		Fuses what would otherwise be three separate model builds (get_view_model,
+		serialize_view_model, get_model_statistics) into a single build, so batch
+		callers pay one traversal per view instead of three.
+
+		Returns:
+			tuple: (view_model, serialized_model, stats)
+		"""
+		self.flattened_json = flattened_json
+		self.view_model = self.get_view_model()
+		serialized_model = self.serialize_view_model()
+		stats = self._compute_statistics()
+		return self.view_model, serialized_model, stats
 
 	def get_model_statistics(self, flattened_json: Dict[str, Any]) -> Dict[str, Any]:
 		"""Get statistics about the parsed model for debugging/analysis."""
 		self.flattened_json = flattened_json
 		self.view_model = self.get_view_model()
+		return self._compute_statistics()
 
+	def _compute_statistics(self) -> Dict[str, Any]:
+		"""Compute statistics from the already-built view model."""
 		# Get all nodes for analysis, excluding generic collections to avoid duplicates
 		specific_collections = [
 			'components', 'message_handlers', 'custom_methods', 'expression_bindings',
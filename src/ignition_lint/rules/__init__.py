@@ -6,37 +6,54 @@ for linting Ignition Perspective view files. It includes the dynamic rule
 registration system and auto-discovery of custom rules.
 """
 
+import importlib
+import types
+
 from .common import LintingRule, NodeVisitor, BindingRule
 from .registry import register_rule, get_registry, get_all_rules, discover_rules
 
-# Import and register built-in rules
-from .scripts.lint_script import PylintScriptRule
-from .performance.polling_interval import PollingIntervalRule
-from .naming.name_pattern import NamePatternRule
-from .structure.bad_component_reference import BadComponentReferenceRule
-
-# Auto-discover and register all rules in this package
-_discovered_rules = discover_rules()
+# Built-in rule classes resolved lazily (PEP 562) so importing this package
+# does not pay for heavyweight rule dependencies (e.g. pylint) until a rule
+# class or the rules map is actually used.
+_LAZY_RULE_IMPORTS = {
+	"PylintScriptRule": ".scripts.lint_script",
+	"PollingIntervalRule": ".performance.polling_interval",
+	"NamePatternRule": ".naming.name_pattern",
+	"BadComponentReferenceRule": ".structure.bad_component_reference",
+}
 
 
-# Create RULES_MAP for backward compatibility
 def get_rules_map():
-	"""Get the current rules map for backward compatibility."""
-	return get_all_rules()
-
-
-# Dynamic RULES_MAP that stays up-to-date
-RULES_MAP = get_rules_map()
-
+	"""Get the rules map, running rule discovery on first use."""
+	rules_map = globals().get("RULES_MAP")
+	if rules_map is None:
+		# Snapshot the registry once after discovery; a read-only mapping keeps
+		# every subsequent lookup an O(1) hash probe with no rebuild.
+		discover_rules()
+		rules_map = types.MappingProxyType(dict(get_all_rules()))
+		globals()["RULES_MAP"] = rules_map
+	return rules_map
+
+
+def __getattr__(name):
+	"""Resolve rule classes and RULES_MAP lazily on first attribute access."""
+	if name == "RULES_MAP":
+		return get_rules_map()
+	if name in _LAZY_RULE_IMPORTS:
+		module = importlib.import_module(_LAZY_RULE_IMPORTS[name], __name__)
+		rule_class = getattr(module, name)
+		globals()[name] = rule_class
+		return rule_class
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# The lazily-resolved rule classes and RULES_MAP stay importable through
+# __getattr__ but are deliberately left out of __all__, which only lists
+# names that exist at module load; callers should prefer get_rules_map().
 __all__ = [
 	"LintingRule",
 	"NodeVisitor",
 	"BindingRule",
-	"PylintScriptRule",
-	"PollingIntervalRule",
-	"NamePatternRule",
-	"BadComponentReferenceRule",
-	"RULES_MAP",
+	"get_rules_map",
 	"register_rule",
 	"get_registry",
 	"get_all_rules",
@@ -48,6 +48,11 @@ class NodeVisitor(ABC):
 class LintingRule(NodeVisitor):
 	"""Base class for linting rules with simplified interface and self-processing capability."""
 
+	# Whether create_from_config({}) is expected to succeed. Subclasses that
+	# require configuration should set this to False so batch constructors can
+	# skip them without probing via a throwaway instance.
+	DEFAULT_CONFIG_OK = True
+
 	def __init__(self, target_node_types: Set[NodeType] = None, severity: str = "error", include_private_properties: bool = False):
 		"""
 		Initialize the rule.
@@ -14,9 +14,12 @@ from typing import Dict, List, Any
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
 
 from ignition_lint.linter import LintEngine
-from ignition_lint.rules import RULES_MAP
+from ignition_lint.rules import get_rules_map
 from ignition_lint.common.flatten_json import flatten_file
 
+# Resolved once at import; the fixtures construct rules immediately anyway
+RULES_MAP = get_rules_map()
+
 
 class BaseRuleTest(unittest.TestCase):
 	"""Base class for testing individual linting rules."""
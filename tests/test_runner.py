@@ -6,6 +6,7 @@ This script provides a simple command-line interface for running organized tests
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
@@ -19,7 +20,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 
 
 
-def discover_and_run_unit_tests(test_pattern=None, verbosity=2):
+def discover_and_run_unit_tests(test_pattern=None, verbosity=2, runner=None):
 	"""Discover and run unit tests from the unit/ directory."""
 	test_dir = Path(__file__).parent / "unit"
 	print("=" * 60)
@@ -28,7 +29,7 @@ def discover_and_run_unit_tests(test_pattern=None, verbosity=2):
 
 	if not test_dir.exists():
 		print(f"Unit tests directory not found: {test_dir}")
-		return False
+		return None
 
 	# Discover tests
 	loader = unittest.TestLoader()
@@ -38,13 +39,11 @@ def discover_and_run_unit_tests(test_pattern=None, verbosity=2):
 		suite = loader.discover(str(test_dir), pattern="test_*.py")
 
 	# Run tests
-	runner = unittest.TextTestRunner(verbosity=verbosity)
-	result = runner.run(suite)
-
-	return result.wasSuccessful()
+	runner = runner or unittest.TextTestRunner(verbosity=verbosity)
+	return runner.run(suite)
 
 
-def discover_and_run_integration_tests(test_pattern=None, verbosity=2):
+def discover_and_run_integration_tests(test_pattern=None, verbosity=2, runner=None):
 	"""Discover and run integration tests from the integration/ directory."""
 	test_dir = Path(__file__).parent / "integration"
 
@@ -54,7 +53,7 @@ def discover_and_run_integration_tests(test_pattern=None, verbosity=2):
 
 	if not test_dir.exists():
 		print(f"Integration tests directory not found: {test_dir}")
-		return False
+		return None
 
 	# Discover tests
 	loader = unittest.TestLoader()
@@ -64,10 +63,47 @@ def discover_and_run_integration_tests(test_pattern=None, verbosity=2):
 		suite = loader.discover(str(test_dir), pattern="test_*.py")
 
 	# Run tests
-	runner = unittest.TextTestRunner(verbosity=verbosity)
-	result = runner.run(suite)
+	runner = runner or unittest.TextTestRunner(verbosity=verbosity)
+	return runner.run(suite)
+
+
+def discover_and_run_all_tests(unit_pattern=None, integration_pattern=None, verbosity=2, runner=None):
+	"""Discover unit and integration tests with one loader and run them in a single pass."""
+	base_dir = Path(__file__).parent
+
+	print("=" * 60)
+	print("RUNNING UNIT AND INTEGRATION TESTS")
+	print("=" * 60)
+
+	# One loader and one top_level_dir means shared modules are imported once
+	# and both directory walks feed a single runner invocation
+	loader = unittest.TestLoader()
+	suite = unittest.TestSuite()
+	found_any = False
+
+	for test_dir, pattern in ((base_dir / "unit", unit_pattern), (base_dir / "integration", integration_pattern)):
+		if not test_dir.exists():
+			print(f"Tests directory not found: {test_dir}")
+			continue
+		found_any = True
+		suite.addTests(loader.discover(str(test_dir), pattern=pattern or "test_*.py", top_level_dir=str(base_dir)))
+
+	if not found_any:
+		return None
+
+	runner = runner or unittest.TextTestRunner(verbosity=verbosity)
+	return runner.run(suite)
+
 
-	return result.wasSuccessful()
+# Shared loader for specific-file runs; repeated invocations (e.g. from
+# run_test_by_name) reuse it instead of constructing one per call
+_LOADER = unittest.TestLoader()
+
+
+@functools.lru_cache(maxsize=None)
+def _module_name_for(relative_path: str) -> str:
+	"""Translate a test file path relative to this directory into a module name."""
+	return relative_path.removesuffix('.py').replace('/', '.').replace('\\', '.')
 
 
 def run_specific_test_file(test_file, verbosity=2):
@@ -81,15 +117,11 @@ def run_specific_test_file(test_file, verbosity=2):
 			print(f"Test file not found: {test_file}")
 			return False
 
-	# Load and run the specific test module
-	loader = unittest.TestLoader()
-
-	# Convert path to module name
-	relative_path = test_path.relative_to(Path(__file__).parent)
-	module_name = str(relative_path.with_suffix('')).replace('/', '.').replace('\\', '.')
+	# Convert path to module name (cached per file across invocations)
+	module_name = _module_name_for(str(test_path.relative_to(Path(__file__).parent)))
 
 	try:
-		suite = loader.loadTestsFromName(module_name)
+		suite = _LOADER.loadTestsFromName(module_name)
 		runner = unittest.TextTestRunner(verbosity=verbosity)
 		result = runner.run(suite)
 		return result.wasSuccessful()
@@ -104,31 +136,51 @@ def list_available_tests():
 	print("Available Test Categories:\n")
 
 	base_dir = Path(__file__).parent
+	unit_dir = str(base_dir / "unit")
+	integration_dir = str(base_dir / "integration")
+	cases_dir = base_dir / "cases"
+	cases_root = str(cases_dir)
+
+	top_dirs = set()
+	unit_tests = []
+	integration_tests = []
+	case_dirs = []
+	case_views = {}
+
+	# One walk over the tests tree replaces the separate glob pass per
+	# category; __pycache__ and results subtrees are pruned outright
+	for root, dirs, files in os.walk(base_dir):
+		dirs[:] = [d for d in dirs if d not in ('__pycache__', 'results')]
+		if root == str(base_dir):
+			top_dirs = set(dirs)
+		elif root == unit_dir:
+			unit_tests = sorted(f for f in files if f.startswith('test_') and f.endswith('.py'))
+		elif root == integration_dir:
+			integration_tests = sorted(f for f in files if f.startswith('test_') and f.endswith('.py'))
+		elif root == cases_root:
+			case_dirs = sorted(dirs)
+		elif root.startswith(cases_root + os.sep) and 'view.json' in files:
+			relative_dir = Path(root).relative_to(cases_dir)
+			case_views.setdefault(relative_dir.parts[0], []).append(relative_dir / 'view.json')
 
 	# List unit tests
-	unit_dir = base_dir / "unit"
-	if unit_dir.exists():
+	if 'unit' in top_dirs:
 		print("1. Unit Tests:")
-		for test_file in sorted(unit_dir.glob("test_*.py")):
-			print(f"   - {test_file.stem}")
+		for test_file in unit_tests:
+			print(f"   - {test_file.removesuffix('.py')}")
 
 	# List integration tests
-	integration_dir = base_dir / "integration"
-	if integration_dir.exists():
+	if 'integration' in top_dirs:
 		print("\n2. Integration Tests:")
-		for test_file in sorted(integration_dir.glob("test_*.py")):
-			print(f"   - {test_file.stem}")
+		for test_file in integration_tests:
+			print(f"   - {test_file.removesuffix('.py')}")
 
 	# List test case directories
 	print("\n3. Test Cases Directory Structure:")
-	cases_dir = base_dir / "cases"
-	if cases_dir.exists():
-		for case_dir in sorted(cases_dir.iterdir()):
-			if case_dir.is_dir():
-				view_files = list(case_dir.glob("**/view.json"))
-				print(f"   {case_dir.name}/")
-				for vf in view_files:
-					print(f"     - {vf.relative_to(cases_dir)}")
+	for case_name in case_dirs:
+		print(f"   {case_name}/")
+		for view_file in sorted(case_views.get(case_name, [])):
+			print(f"     - {view_file}")
 
 
 def setup_test_environment():
@@ -258,19 +310,23 @@ def main():
 		parser.print_help()
 		return 1
 
-	success = True
-
-	# Run unit tests
-	if run_unit:
-		success = discover_and_run_unit_tests(args.unit_pattern, verbosity) and success
-
-	# Run integration tests
-	if run_integration:
-		success = discover_and_run_integration_tests(args.integration_pattern, verbosity) and success
+	# One runner serves whichever suites run this invocation, and the paths
+	# hand back the unittest result so the summary can report real counts
+	runner = unittest.TextTestRunner(verbosity=verbosity)
+	if run_unit and run_integration:
+		result = discover_and_run_all_tests(args.unit_pattern, args.integration_pattern, runner=runner)
+	elif run_unit:
+		result = discover_and_run_unit_tests(args.unit_pattern, runner=runner)
+	else:
+		result = discover_and_run_integration_tests(args.integration_pattern, runner=runner)
 
 	# Final result
 	print("\n" + "=" * 60)
-	if not success:
+	if result is None:
+		print("SOME TESTS FAILED ❌")
+		return 1
+	print(f"Ran {result.testsRun} tests: {len(result.failures)} failures, {len(result.errors)} errors")
+	if not result.wasSuccessful():
 		print("SOME TESTS FAILED ❌")
 		return 1
 	print("ALL TESTS PASSED ✅")
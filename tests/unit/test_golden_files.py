@@ -23,7 +23,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
 from ignition_lint.common.flatten_json import read_json_file, flatten_json
 from ignition_lint.linter import LintEngine
-from ignition_lint.rules import RULES_MAP
+from ignition_lint.rules import get_rules_map
+
+RULES_MAP = get_rules_map()
 
 
 class TestGoldenFiles(unittest.TestCase):